@@ -21,8 +21,10 @@ from cursor_docs_content import (
     get_prompt_templates,
     STARTER_PACK_PROMPT,
     get_generic_commands,
+    get_generic_command_index,
     get_external_resources,
     get_community_rule_examples,
+    get_community_rule_labels,
     generate_starter_kit_zip,
     generate_custom_starter_kit_zip,
     get_starter_kit_contents,
@@ -33,6 +35,7 @@ from cursor_docs_content import (
     build_rule_content,
     validate_rule,
     STARTER_KIT_AGENTS_MD,
+    STARTER_KIT_AGENTS_MD_BYTES,
     SKILL_FRONTMATTER_FIELDS,
     get_skills_docs,
     get_subagents_docs,
@@ -287,6 +290,130 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ============================================================================
+# STATIC TEMPLATES
+# ============================================================================
+
+# Downloadable meta-rule shown in the Resources tab
+RULE_SELF_IMPROVEMENT_MD = """---
+description: Guidelines for continuously improving Cursor rules based on emerging patterns
+globs: []
+alwaysApply: true
+---
+
+# Rule Self-Improvement Guidelines
+
+## When to Add New Rules
+
+- A pattern is used in **3+ files** consistently
+- Common bugs could be prevented by standardization
+- Code reviews repeatedly mention the same feedback
+- New security or performance patterns emerge
+
+## When to Update Existing Rules
+
+- Better examples exist in the codebase
+- Additional edge cases are discovered
+- Implementation details have changed
+- Related rules have been updated
+
+## Pattern Recognition Examples
+
+When you see repeated patterns like:
+
+```python
+# Repeated logging setup
+from utils.logging import get_logger
+logger = get_logger(__name__)
+```
+
+→ Add to `coding-standards.mdc` with standardized examples.
+
+When you see repeated error handling:
+
+```python
+try:
+    result = await operation()
+except SpecificError as e:
+    logger.error(f"Failed: {e}")
+    raise HTTPException(status_code=500, detail=str(e))
+```
+
+→ Document in your API conventions rule.
+
+## Rule Quality Checklist
+
+- [ ] Rules are actionable and specific
+- [ ] Examples come from actual codebase
+- [ ] Patterns are consistently enforced
+- [ ] No outdated references
+
+## Continuous Improvement
+
+- Monitor code review comments for patterns
+- Update rules after major refactors
+- Deprecate rules that no longer apply
+- Cross-reference related rules
+
+See @.cursor/rules/cursor-rules.mdc for formatting guidelines."""
+RULE_SELF_IMPROVEMENT_BYTES = RULE_SELF_IMPROVEMENT_MD.encode("utf-8")
+
+# Page footer with doc links, emitted once at the bottom of every run
+FOOTER_HTML = """
+---
+
+<div style="text-align: center; padding: 1.5rem 1rem;">
+    <p style="font-size: 0.95rem; margin-bottom: 1rem; opacity: 0.75;">
+        Built with ❤️ using Streamlit
+    </p>
+    <div style="display: flex; justify-content: center; gap: 1.5rem; flex-wrap: wrap; margin-bottom: 1rem;">
+        <a href="https://cursor.com/docs/rules" target="_blank"
+           style="color: #3b82f6; text-decoration: none; font-weight: 500;">📘 Rules Docs</a>
+        <a href="https://cursor.com/docs/skills" target="_blank"
+           style="color: #22c55e; text-decoration: none; font-weight: 500;">📗 Skills Docs</a>
+        <a href="https://cursor.directory" target="_blank"
+           style="color: #f59e0b; text-decoration: none; font-weight: 500;">🌐 cursor.directory</a>
+        <a href="https://github.com/PatrickJS/awesome-cursorrules" target="_blank"
+           style="color: #8b5cf6; text-decoration: none; font-weight: 500;">⭐ awesome-cursorrules</a>
+    </div>
+    <p style="font-size: 0.75rem; opacity: 0.6; max-width: 600px; margin: 0 auto;">
+        Official examples from Cursor docs · Community examples from cursor.directory
+    </p>
+</div>
+"""
+
+# ============================================================================
+# RENDER HELPERS
+# ============================================================================
+# Static content is rendered to HTML once per process and reused across reruns.
+
+@st.cache_data(show_spinner=False)
+def render_resource_cards_html(category: str, num_columns: int) -> list:
+    """Returns one pre-rendered HTML blob per column for a resource category."""
+    columns = [[] for _ in range(num_columns)]
+    for idx, resource in enumerate(get_external_resources(category)[category]):
+        if category == "official":
+            card = (
+                '<div class="rule-card">\n'
+                f"<h4>{resource['icon']} {resource['name']}</h4>\n"
+                f"<p>{resource['description']}</p>\n"
+                f'<a href="{resource["url"]}" target="_blank">🔗 View Documentation →</a>\n'
+                "</div>"
+            )
+        else:
+            stars_badge = f"⭐ {resource.get('stars', '')}" if resource.get('stars') else ""
+            card = (
+                '<div style="background: rgba(88, 166, 255, 0.05); border-radius: 8px; padding: 1rem; margin: 0.5rem 0; min-height: 180px;">\n'
+                f"<h4>{resource['icon']} {resource['name']}</h4>\n"
+                f'<p style="font-size: 0.9rem;">{resource["description"]}</p>\n'
+                f"<p>{stars_badge}</p>\n"
+                f'<a href="{resource["url"]}" target="_blank">Visit →</a>\n'
+                "</div>"
+            )
+        columns[idx % num_columns].append(card)
+    return ["\n".join(cards) for cards in columns]
+
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
@@ -1483,7 +1610,7 @@ with tab_commands:
         """)
 
         starter_skills = get_starter_kit_skills()
-        generic_commands = get_generic_commands()
+        command_descriptions = get_generic_command_index()
 
         skill_categories = {
             "Code Quality": ["code-review-checklist", "refactor", "explain"],
@@ -1496,7 +1623,7 @@ with tab_commands:
             st.markdown(f"**{category}**")
             for key in skill_keys:
                 if key in starter_skills:
-                    desc = generic_commands.get(key, {}).get("description", "")
+                    desc = command_descriptions.get(key, "")
                     with st.expander(f"⚡ **/{key}** — {desc}"):
                         st.markdown(f"**Save to:** `.cursor/skills/{key}/SKILL.md`")
                         st.code(starter_skills[key], language="markdown")
@@ -1689,32 +1816,26 @@ with tab_resources:
     st.markdown("---")
     
     # Official Resources
-    st.markdown("### 📘 Official Cursor Documentation")
     st.markdown("""
+    ### 📘 Official Cursor Documentation
+
     <div class="info-card">
         <strong>✅ Verified Source</strong>: These links point directly to Cursor's official documentation.
         Always refer to official docs for the most accurate and up-to-date information.
     </div>
     """, unsafe_allow_html=True)
     
-    resources = get_external_resources()
-    
     cols = st.columns(2)
-    for idx, resource in enumerate(resources["official"]):
-        with cols[idx % 2]:
-            st.markdown(f"""
-            <div class="rule-card">
-                <h4>{resource['icon']} {resource['name']}</h4>
-                <p>{resource['description']}</p>
-                <a href="{resource['url']}" target="_blank">🔗 View Documentation →</a>
-            </div>
-            """, unsafe_allow_html=True)
+    for col, cards_html in zip(cols, render_resource_cards_html("official", 2)):
+        with col:
+            st.markdown(cards_html, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Community Resources
-    st.markdown("### 🌐 Community Resources")
     st.markdown("""
+    ### 🌐 Community Resources
+
     <div class="command-card">
         <strong>⚠️ Community Content</strong>: These are popular community-maintained resources. 
         While widely used and helpful, always verify rules work for your specific project.
@@ -1722,45 +1843,34 @@ with tab_resources:
     """, unsafe_allow_html=True)
     
     cols = st.columns(3)
-    for idx, resource in enumerate(resources["community"]):
-        with cols[idx % 3]:
-            stars_badge = f"⭐ {resource.get('stars', '')}" if resource.get('stars') else ""
-            st.markdown(f"""
-            <div style="background: rgba(88, 166, 255, 0.05); border-radius: 8px; padding: 1rem; margin: 0.5rem 0; min-height: 180px;">
-                <h4>{resource['icon']} {resource['name']}</h4>
-                <p style="font-size: 0.9rem;">{resource['description']}</p>
-                <p>{stars_badge}</p>
-                <a href="{resource['url']}" target="_blank">Visit →</a>
-            </div>
-            """, unsafe_allow_html=True)
+    for col, cards_html in zip(cols, render_resource_cards_html("community", 3)):
+        with col:
+            st.markdown(cards_html, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Tech-specific rule examples
-    st.markdown("### 🛠️ Tech-Specific Rule Examples")
     st.markdown("""
+    ### 🛠️ Tech-Specific Rule Examples
+
     Ready-to-use rule templates for popular frameworks and languages. 
     These are based on **community best practices** from cursor.directory and other sources.
     """)
     
     community_rules = get_community_rule_examples()
+    tech_labels = get_community_rule_labels()
     
     # Tech selector
-    tech_options = list(community_rules.keys())
-    tech_labels = {k: v["name"] for k, v in community_rules.items()}
-    
-    cols = st.columns(len(tech_options))
-    for idx, tech_key in enumerate(tech_options):
-        with cols[idx]:
-            if st.button(
-                f"📦 {tech_labels[tech_key]}", 
-                key=f"tech_{tech_key}",
-                use_container_width=True
-            ):
-                st.session_state.selected_tech = tech_key
+    selected_tech = st.radio(
+        "Tech stack",
+        options=tuple(tech_labels),
+        format_func=lambda k: f"📦 {tech_labels[k]}",
+        horizontal=True,
+        key="selected_tech",
+        label_visibility="collapsed",
+    )
     
     # Display selected tech rule
-    selected_tech = st.session_state.get("selected_tech", "react-typescript")
     if selected_tech in community_rules:
         rule = community_rules[selected_tech]
         
@@ -1772,7 +1882,7 @@ with tab_resources:
         
         st.download_button(
             label=f"⬇️ Download {rule['name'].lower().replace(' ', '-')}-rule.md",
-            data=rule['content'],
+            data=rule['content_bytes'],
             file_name=f"{selected_tech}-rule.md",
             mime="text/markdown",
             key=f"download_tech_{selected_tech}",
@@ -1784,8 +1894,9 @@ with tab_resources:
     # AGENTS.MD SECTION
     # =========================================================================
     
-    st.markdown("### 📄 AGENTS.md - Simple Alternative")
     st.markdown("""
+    ### 📄 AGENTS.md - Simple Alternative
+
     **AGENTS.md** is an open standard for AI agent guidance that works with multiple tools including Cursor, GitHub Copilot, and others.
     It's a single markdown file placed in your project root — simpler than managing multiple rule files.
     """)
@@ -1808,7 +1919,7 @@ with tab_resources:
     with col_agents2:
         st.download_button(
             label="⬇️ Download AGENTS.md Template",
-            data=STARTER_KIT_AGENTS_MD,
+            data=STARTER_KIT_AGENTS_MD_BYTES,
             file_name="AGENTS.md",
             mime="text/markdown",
             key="download_agents_md_resources",
@@ -1826,9 +1937,11 @@ with tab_resources:
     st.caption("The releases that reshaped rules, skills, and agents — this app's content tracks them.")
 
     with st.expander("📅 **Release timeline** — Cursor 2.4 → 3.10", expanded=False):
-        for entry in get_whats_new():
-            st.markdown(f"**{entry['version']}** · *{entry['date']}* — {entry['highlights']}")
-        st.markdown("[📘 Full changelog →](https://cursor.com/changelog)")
+        timeline_md = "\n\n".join(
+            f"**{entry['version']}** · *{entry['date']}* — {entry['highlights']}"
+            for entry in get_whats_new()
+        )
+        st.markdown(timeline_md + "\n\n[📘 Full changelog →](https://cursor.com/changelog)")
 
     st.markdown("---")
 
@@ -1882,81 +1995,19 @@ with tab_resources:
         st.markdown('Every `hooks.json` must declare `"version": 1`, and each hook name maps to a **list** of entries:')
         st.code(hooks_docs['example'], language="json")
         st.markdown(f"**Per-entry options:** {hooks_docs['options_summary']}")
-        st.markdown("**All Available Hooks:**")
+        hooks_md = ["**All Available Hooks:**"]
         for group_name, hooks in hooks_docs['hook_groups'].items():
-            st.markdown(f"**{group_name}:**")
-            for hook in hooks:
-                st.markdown(f"- **`{hook['name']}`** — {hook['description']}")
-        st.markdown("[📘 View Official Hooks Documentation](https://cursor.com/docs/hooks)")
+            hooks_md.append(f"**{group_name}:**")
+            hooks_md.append("\n".join(f"- **`{hook['name']}`** — {hook['description']}" for hook in hooks))
+        hooks_md.append("[📘 View Official Hooks Documentation](https://cursor.com/docs/hooks)")
+        st.markdown("\n\n".join(hooks_md))
     
     # Rule Self-Improvement template download
     with st.expander("📄 **Download Rule Self-Improvement Template**", expanded=False):
-        rule_self_improvement = """---
-description: Guidelines for continuously improving Cursor rules based on emerging patterns
-globs: []
-alwaysApply: true
----
-
-# Rule Self-Improvement Guidelines
-
-## When to Add New Rules
-
-- A pattern is used in **3+ files** consistently
-- Common bugs could be prevented by standardization
-- Code reviews repeatedly mention the same feedback
-- New security or performance patterns emerge
-
-## When to Update Existing Rules
-
-- Better examples exist in the codebase
-- Additional edge cases are discovered
-- Implementation details have changed
-- Related rules have been updated
-
-## Pattern Recognition Examples
-
-When you see repeated patterns like:
-
-```python
-# Repeated logging setup
-from utils.logging import get_logger
-logger = get_logger(__name__)
-```
-
-→ Add to `coding-standards.mdc` with standardized examples.
-
-When you see repeated error handling:
-
-```python
-try:
-    result = await operation()
-except SpecificError as e:
-    logger.error(f"Failed: {e}")
-    raise HTTPException(status_code=500, detail=str(e))
-```
-
-→ Document in your API conventions rule.
-
-## Rule Quality Checklist
-
-- [ ] Rules are actionable and specific
-- [ ] Examples come from actual codebase
-- [ ] Patterns are consistently enforced
-- [ ] No outdated references
-
-## Continuous Improvement
-
-- Monitor code review comments for patterns
-- Update rules after major refactors
-- Deprecate rules that no longer apply
-- Cross-reference related rules
-
-See @.cursor/rules/cursor-rules.mdc for formatting guidelines."""
-        
-        st.code(rule_self_improvement, language="markdown")
+        st.code(RULE_SELF_IMPROVEMENT_MD, language="markdown")
         st.download_button(
             label="⬇️ Download rule-self-improvement.mdc",
-            data=rule_self_improvement,
+            data=RULE_SELF_IMPROVEMENT_BYTES,
             file_name="rule-self-improvement.mdc",
             mime="text/markdown",
             key="download_rule_self_improvement",
@@ -2005,24 +2056,4 @@ See @.cursor/rules/cursor-rules.mdc for formatting guidelines."""
 # FOOTER
 # ============================================================================
 
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; padding: 1.5rem 1rem;">
-    <p style="font-size: 0.95rem; margin-bottom: 1rem; opacity: 0.75;">
-        Built with ❤️ using Streamlit
-    </p>
-    <div style="display: flex; justify-content: center; gap: 1.5rem; flex-wrap: wrap; margin-bottom: 1rem;">
-        <a href="https://cursor.com/docs/rules" target="_blank"
-           style="color: #3b82f6; text-decoration: none; font-weight: 500;">📘 Rules Docs</a>
-        <a href="https://cursor.com/docs/skills" target="_blank"
-           style="color: #22c55e; text-decoration: none; font-weight: 500;">📗 Skills Docs</a>
-        <a href="https://cursor.directory" target="_blank"
-           style="color: #f59e0b; text-decoration: none; font-weight: 500;">🌐 cursor.directory</a>
-        <a href="https://github.com/PatrickJS/awesome-cursorrules" target="_blank"
-           style="color: #8b5cf6; text-decoration: none; font-weight: 500;">⭐ awesome-cursorrules</a>
-    </div>
-    <p style="font-size: 0.75rem; opacity: 0.6; max-width: 600px; margin: 0 auto;">
-        Official examples from Cursor docs · Community examples from cursor.directory
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
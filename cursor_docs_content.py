@@ -5,12 +5,22 @@ This module contains structured data about Cursor Rules vs Commands,
 and functions to load and process example files.
 """
 
+import functools
 import io
 import os
 import re
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # ============================================================================
 # CORE DEFINITIONS
@@ -195,9 +205,7 @@ COMMON_GLOB_PRESETS = {
 # COMPARISON UTILITIES
 # ============================================================================
 
-def get_comparison_table() -> str:
-    """Returns a markdown table comparing Rules vs Commands."""
-    table = """
+_COMPARISON_TABLE_MD = """
 | Aspect | Rules | Commands |
 |--------|-------|----------|
 | **Purpose** | Provide persistent context/guidance | Execute specific actions on demand |
@@ -207,72 +215,121 @@ def get_comparison_table() -> str:
 | **Invocation** | Automatic | Manual |
 | **Scope** | Project-wide persistent context | Single action |
 | **Use Cases** | Coding standards, architecture docs | Code reviews, generators |
-"""
-    return table.strip()
+""".strip()
 
 
-def get_comparison_data() -> List[Dict]:
-    """Returns comparison data as a list of dicts for programmatic use."""
-    aspects = ["purpose", "location", "triggered_by", "format", "invocation", "scope", "use_cases"]
-    return [
-        {
-            "aspect": aspect.replace("_", " ").title(),
-            "rules": RULES_VS_COMMANDS["rules"].get(aspect, ""),
-            "commands": RULES_VS_COMMANDS["commands"].get(aspect, ""),
-        }
-        for aspect in aspects
-    ]
+def get_comparison_table() -> str:
+    """Returns a markdown table comparing Rules vs Commands."""
+    return _COMPARISON_TABLE_MD
+
+
+_COMPARISON_ROWS = tuple(
+    MappingProxyType({
+        "aspect": aspect.replace("_", " ").title(),
+        "rules": RULES_VS_COMMANDS["rules"].get(aspect, ""),
+        "commands": RULES_VS_COMMANDS["commands"].get(aspect, ""),
+    })
+    for aspect in ("purpose", "location", "triggered_by", "format", "invocation", "scope", "use_cases")
+)
+
+
+def get_comparison_data() -> Tuple[Mapping, ...]:
+    """Returns read-only comparison rows (aspect, rules, commands) for programmatic use."""
+    return _COMPARISON_ROWS
+
+
+def _build_rule_frontmatter_docs() -> str:
+    """Renders the frontmatter field reference as markdown."""
+    parts = ["## Rule Frontmatter Fields\n\n"]
+    for field, info in FRONTMATTER_FIELDS.items():
+        parts.append(
+            f"### `{field}`\n"
+            f"- **Type**: `{info['type']}`\n"
+            f"- **Required**: {'Yes' if info['required'] else 'No'}\n"
+            f"- **Description**: {info['description']}\n"
+            f"- **Example**:\n```yaml\n{info['example']}\n```\n\n"
+        )
+    return "".join(parts)
+
+
+_RULE_FRONTMATTER_DOCS_MD = _build_rule_frontmatter_docs()
 
 
 def get_rule_frontmatter_docs() -> str:
     """Returns documentation for rule frontmatter fields."""
-    docs = "## Rule Frontmatter Fields\n\n"
-    for field, info in FRONTMATTER_FIELDS.items():
-        docs += f"### `{field}`\n"
-        docs += f"- **Type**: `{info['type']}`\n"
-        docs += f"- **Required**: {'Yes' if info['required'] else 'No'}\n"
-        docs += f"- **Description**: {info['description']}\n"
-        docs += f"- **Example**:\n```yaml\n{info['example']}\n```\n\n"
-    return docs
+    return _RULE_FRONTMATTER_DOCS_MD
 
 
 # ============================================================================
 # FILE LOADING UTILITIES
 # ============================================================================
 
+_PROJECT_ROOT = Path(__file__).resolve().parent
+
+
 def get_project_root() -> Path:
     """Returns the project root directory (same directory as this file)."""
-    current_file = Path(__file__).resolve()
-    return current_file.parent
+    return _PROJECT_ROOT
+
 
+def _scan_files(directory: Path, suffixes: Tuple[str, ...]) -> Tuple[Tuple[str, str, int], ...]:
+    """Lists (name, path, mtime_ns) for files ending with one of the suffixes, sorted by name."""
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(sorted(
+                (entry.name, entry.path, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(suffixes) and entry.is_file()
+            ))
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
 
-def load_example_files() -> Dict[str, Dict[str, str]]:
+
+def _read_files(files: Tuple[Tuple[str, str, int], ...]) -> Mapping[str, str]:
+    """Reads scanned files into a read-only name -> content mapping."""
+    contents = {}
+    for name, path, _ in files:
+        with open(path, encoding="utf-8") as f:
+            contents[name] = f.read()
+    return MappingProxyType(contents)
+
+
+# Last load_example_files() result, keyed by both directory paths and the
+# (name, path, mtime_ns) listing of each
+_example_cache: Dict[Tuple, Mapping[str, Mapping[str, str]]] = {}
+
+
+def load_example_files() -> Mapping[str, Mapping[str, str]]:
     """
     Loads actual rule and command files from the .cursor/ directory.
 
+    The result is cached until a file is added, removed or modified in
+    either directory (tracked via per-file mtimes), so reruns skip the reads.
+
     Returns:
-        Dict with 'rules' and 'commands' keys, each containing
+        Read-only mapping with 'rules' and 'commands' keys, each containing
         filename -> content mappings.
     """
     project_root = get_project_root()
-
-    result = {
-        "rules": {},
-        "commands": {},
-    }
-
-    # Load rules (.mdc is the required extension; .md kept for legacy files)
     rules_dir = project_root / ".cursor" / "rules"
-    if rules_dir.exists():
-        for file_path in sorted(list(rules_dir.glob("*.mdc")) + list(rules_dir.glob("*.md"))):
-            result["rules"][file_path.name] = file_path.read_text(encoding="utf-8")
-    
-    # Load commands
     commands_dir = project_root / ".cursor" / "commands"
-    if commands_dir.exists():
-        for file_path in commands_dir.glob("*.md"):
-            result["commands"][file_path.name] = file_path.read_text(encoding="utf-8")
-    
+
+    # .mdc is the required rule extension; .md kept for legacy files
+    rule_files = _scan_files(rules_dir, (".mdc", ".md"))
+    command_files = _scan_files(commands_dir, (".md",))
+
+    cache_key = (str(rules_dir), rule_files, str(commands_dir), command_files)
+    cached = _example_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = MappingProxyType({
+        "rules": _read_files(rule_files),
+        "commands": _read_files(command_files),
+    })
+
+    _example_cache.clear()
+    _example_cache[cache_key] = result
     return result
 
 
@@ -287,61 +344,63 @@ def parse_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
         Tuple of (frontmatter_dict, body_content)
         frontmatter_dict is None if no frontmatter found
     """
-    import yaml
-    
-    if not content.startswith("---"):
+    # The opening delimiter line may carry trailing whitespace (or a \r)
+    first_line, _, rest = content.partition("\n")
+    if first_line.rstrip() != "---":
         return None, content
     
-    # Find the closing ---
-    end_index = content.find("---", 3)
-    if end_index == -1:
+    # Keep the leading newline so an empty block ("---\n---") still finds its closer
+    frontmatter_str, sep, body = ("\n" + rest).partition("\n---")
+    if not sep:
         return None, content
     
-    frontmatter_str = content[3:end_index].strip()
-    body = content[end_index + 3:].strip()
+    frontmatter_str = frontmatter_str.strip()
+    body = body.strip()
     
     try:
-        frontmatter = yaml.safe_load(frontmatter_str)
+        frontmatter = yaml.load(frontmatter_str, Loader=_YamlLoader)
         return frontmatter, body
     except yaml.YAMLError:
         return None, content
 
 
-def get_file_annotations(filename: str, content: str) -> List[Dict]:
+# Explanations shown next to each annotated frontmatter field, in display order
+FRONTMATTER_ANNOTATIONS = {
+    "description": "Brief summary shown in Cursor's UI when browsing rules",
+    "globs": "File patterns that trigger this rule (e.g., **/*.py matches all Python files)",
+    "alwaysApply": "When true, rule is always active regardless of open files",
+}
+
+
+def get_file_annotations(
+    filename: str,
+    content: str,
+    fields: Tuple[str, ...] = tuple(FRONTMATTER_ANNOTATIONS),
+) -> List[Dict]:
     """
     Returns annotations explaining different parts of a file.
     
     Args:
         filename: Name of the file
         content: File content
+        fields: Frontmatter fields to annotate (others are skipped)
         
     Returns:
-        List of annotation dicts with 'line', 'text', and 'explanation' keys
+        List of annotation dicts with 'field', 'value', and 'explanation' keys
     """
-    annotations = []
-    frontmatter, body = parse_frontmatter(content)
-    
-    if frontmatter:
-        if "description" in frontmatter:
-            annotations.append({
-                "field": "description",
-                "value": frontmatter["description"],
-                "explanation": "Brief summary shown in Cursor's UI when browsing rules",
-            })
-        if "globs" in frontmatter:
-            annotations.append({
-                "field": "globs",
-                "value": frontmatter["globs"],
-                "explanation": "File patterns that trigger this rule (e.g., **/*.py matches all Python files)",
-            })
-        if "alwaysApply" in frontmatter:
-            annotations.append({
-                "field": "alwaysApply",
-                "value": frontmatter["alwaysApply"],
-                "explanation": "When true, rule is always active regardless of open files",
-            })
+    frontmatter, _ = parse_frontmatter(content)
+    if not frontmatter:
+        return []
     
-    return annotations
+    return [
+        {
+            "field": field,
+            "value": frontmatter[field],
+            "explanation": FRONTMATTER_ANNOTATIONS[field],
+        }
+        for field in fields
+        if field in frontmatter and field in FRONTMATTER_ANNOTATIONS
+    ]
 
 
 # ============================================================================
@@ -389,42 +448,59 @@ def get_project_structure_template() -> str:
     return PROJECT_STRUCTURE_TEMPLATE
 
 
-def generate_template_based_structure(
+_DEFAULT_TREE = "src/\n├── main.py\n└── utils.py"
+_DEFAULT_RUN_INSTRUCTIONS = "```bash\n# Add your run instructions here\n```"
+_DEFAULT_ENV_VARS = "- Add your environment variables here"
+_EMPTY_OVERVIEW = "A project built with various technologies."
+_EMPTY_TECH_LIST = "- Not specified"
+
+
+@functools.lru_cache(maxsize=128)
+def _render_structure(
     project_name: str,
-    tech_stack: List[str],
+    tech_stack: Tuple[str, ...],
     main_files: str,
     architecture_notes: str,
 ) -> str:
-    """
-    Generates a project-structure.mdc using template-based approach.
-    Used as fallback when no API key is available.
-    """
-    tech_list = "\n".join([f"- **{tech}**" for tech in tech_stack]) if tech_stack else "- Not specified"
-    
+    """Renders PROJECT_STRUCTURE_TEMPLATE; memoized on the (hashable) inputs."""
+    if tech_stack:
+        overview = f"A project built with {', '.join(tech_stack)}."
+        tech_list = "\n".join([f"- **{tech}**" for tech in tech_stack])
+    else:
+        overview = _EMPTY_OVERVIEW
+        tech_list = _EMPTY_TECH_LIST
+
     return PROJECT_STRUCTURE_TEMPLATE.format(
         description=f"Project structure and architecture overview for {project_name}",
         project_name=project_name,
-        overview=f"A project built with {', '.join(tech_stack) if tech_stack else 'various technologies'}.",
-        directory_tree=main_files if main_files else "src/\n├── main.py\n└── utils.py",
+        overview=overview,
+        directory_tree=main_files if main_files else _DEFAULT_TREE,
         architecture=architecture_notes if architecture_notes else "Describe your architecture here.",
         technologies=tech_list,
-        run_instructions="```bash\n# Add your run instructions here\n```",
-        env_vars="- Add your environment variables here",
+        run_instructions=_DEFAULT_RUN_INSTRUCTIONS,
+        env_vars=_DEFAULT_ENV_VARS,
     )
 
 
+def generate_template_based_structure(
+    project_name: str,
+    tech_stack: List[str],
+    main_files: str,
+    architecture_notes: str,
+) -> str:
+    """
+    Generates a project-structure.mdc using template-based approach.
+    Used as fallback when no API key is available.
+    """
+    return _render_structure(project_name, tuple(tech_stack or ()), main_files, architecture_notes)
+
+
 # ============================================================================
 # RULE BUILDER & VALIDATOR
 # ============================================================================
 
-def build_rule_content(
-    description: str,
-    globs: List[str],
-    always_apply: bool,
-    title: str,
-    body: str,
-) -> str:
-    """Builds a complete Cursor rule (.mdc) file from structured inputs."""
+def _rule_frontmatter(description: str, globs: List[str], always_apply: bool) -> str:
+    """Renders the YAML frontmatter block (including both --- delimiters) of a rule."""
     lines = ["---"]
     lines.append(f"description: {description}" if description else "description: ")
 
@@ -437,6 +513,18 @@ def build_rule_content(
 
     lines.append(f"alwaysApply: {'true' if always_apply else 'false'}")
     lines.append("---")
+    return "\n".join(lines)
+
+
+def build_rule_content(
+    description: str,
+    globs: List[str],
+    always_apply: bool,
+    title: str,
+    body: str,
+) -> str:
+    """Builds a complete Cursor rule (.mdc) file from structured inputs."""
+    lines = [_rule_frontmatter(description, globs, always_apply)]
     lines.append("")
     lines.append(f"# {title}" if title else "# Untitled Rule")
     lines.append("")
@@ -608,6 +696,17 @@ def validate_rule(content: str) -> List[Dict]:
 # PROMPT TEMPLATES FOR AI-ASSISTED GENERATION
 # ============================================================================
 
+def _rule_prompt_frontmatter(description: str, globs: str, always_apply: bool) -> str:
+    """Renders the FRONTMATTER section that closes every rule-generation prompt."""
+    return (
+        "\n\n## FRONTMATTER:\n```yaml\n---\n"
+        f"description: {description}\n"
+        f"globs: {globs}\n"
+        f"alwaysApply: {'true' if always_apply else 'false'}\n"
+        "---\n```"
+    )
+
+
 PROMPT_TEMPLATES = {
     "rules": [
         {
@@ -628,16 +727,11 @@ Create a project-structure.mdc rule documenting this project's architecture.
 - Directory tree: max 2 levels deep
 - Do NOT list every file - use annotations like "# API routes"
 - Bullet points over paragraphs
-- No version numbers unless critical
-
-## FRONTMATTER:
-```yaml
----
-description: Project structure for [name]
-globs: []
-alwaysApply: true
----
-```""",
+- No version numbers unless critical""" + _rule_prompt_frontmatter(
+                "Project structure for [name]",
+                "[]",
+                always_apply=True,
+            ),
             "output_file": ".cursor/rules/project-structure.mdc",
         },
         {
@@ -657,16 +751,11 @@ Create a coding-standards.mdc rule based on patterns found in this codebase.
 - Maximum 60 lines total
 - Include 1-2 real code examples from THIS codebase
 - Bullet points only, no lengthy explanations
-- Focus on patterns that repeat across 3+ files
-
-## FRONTMATTER:
-```yaml
----
-description: Coding standards for [project name]
-globs: ["**/*.[ext]"]  # Use actual file extensions
-alwaysApply: false
----
-```""",
+- Focus on patterns that repeat across 3+ files""" + _rule_prompt_frontmatter(
+                "Coding standards for [project name]",
+                '["**/*.[ext]"]  # Use actual file extensions',
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/coding-standards.mdc",
         },
         {
@@ -687,16 +776,11 @@ Create a tech-stack.mdc rule with best practices for this project's technologies
 - Check package.json, requirements.txt, go.mod, Cargo.toml, etc.
 - Include only technologies actively used
 - 1 example per major technology max
-- Bullet points over prose
-
-## FRONTMATTER:
-```yaml
----
-description: Tech stack guidelines for [project name]
-globs: []
-alwaysApply: false
----
-```""",
+- Bullet points over prose""" + _rule_prompt_frontmatter(
+                "Tech stack guidelines for [project name]",
+                "[]",
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/tech-stack.mdc",
         },
         {
@@ -716,16 +800,11 @@ Create an api-conventions.mdc rule documenting API patterns in this project.
 - Maximum 60 lines total
 - Include 1 real endpoint example from codebase
 - Focus on patterns, not exhaustive documentation
-- Skip sections not applicable to this project
-
-## FRONTMATTER:
-```yaml
----
-description: API conventions for [project name]
-globs: ["**/routes/**", "**/api/**", "**/controllers/**"]
-alwaysApply: false
----
-```""",
+- Skip sections not applicable to this project""" + _rule_prompt_frontmatter(
+                "API conventions for [project name]",
+                '["**/routes/**", "**/api/**", "**/controllers/**"]',
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/api-conventions.mdc",
         },
         {
@@ -745,16 +824,11 @@ Create a testing-conventions.mdc rule based on test patterns in this project.
 - Maximum 50 lines total
 - Include 1 real test example from codebase
 - Only document patterns that exist in the project
-- Skip if no tests exist (note this instead)
-
-## FRONTMATTER:
-```yaml
----
-description: Testing conventions for [project name]
-globs: ["**/*test*", "**/*spec*", "**/tests/**"]
-alwaysApply: false
----
-```""",
+- Skip if no tests exist (note this instead)""" + _rule_prompt_frontmatter(
+                "Testing conventions for [project name]",
+                '["**/*test*", "**/*spec*", "**/tests/**"]',
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/testing-conventions.mdc",
         },
         {
@@ -774,16 +848,11 @@ Create a data-models.mdc rule documenting database patterns in this project.
 - Maximum 60 lines total
 - Include 1 model example from codebase
 - Focus on patterns, not full schema documentation
-- Skip sections not applicable
-
-## FRONTMATTER:
-```yaml
----
-description: Data modeling conventions for [project name]
-globs: ["**/models/**", "**/schemas/**", "**/entities/**"]
-alwaysApply: false
----
-```""",
+- Skip sections not applicable""" + _rule_prompt_frontmatter(
+                "Data modeling conventions for [project name]",
+                '["**/models/**", "**/schemas/**", "**/entities/**"]',
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/data-models.mdc",
         },
         {
@@ -803,16 +872,11 @@ Create a component-architecture.mdc rule for UI patterns in this project.
 - Maximum 60 lines total
 - Include 1 component example from codebase
 - Focus on patterns used consistently
-- Skip if not a frontend project
-
-## FRONTMATTER:
-```yaml
----
-description: Component architecture for [project name]
-globs: ["**/components/**", "**/*.tsx", "**/*.jsx"]
-alwaysApply: false
----
-```""",
+- Skip if not a frontend project""" + _rule_prompt_frontmatter(
+                "Component architecture for [project name]",
+                '["**/components/**", "**/*.tsx", "**/*.jsx"]',
+                always_apply=False,
+            ),
             "output_file": ".cursor/rules/component-architecture.mdc",
         },
         {
@@ -832,16 +896,11 @@ Create a rule-self-improvement.mdc that helps keep Cursor rules updated.
 - Maximum 70 lines total
 - Use REAL examples from this codebase
 - Reference existing rule files if any
-- Focus on project-specific triggers
-
-## FRONTMATTER:
-```yaml
----
-description: Guidelines for improving Cursor rules
-globs: [".cursor/rules/*"]
-alwaysApply: true
----
-```""",
+- Focus on project-specific triggers""" + _rule_prompt_frontmatter(
+                "Guidelines for improving Cursor rules",
+                '[".cursor/rules/*"]',
+                always_apply=True,
+            ),
             "output_file": ".cursor/rules/rule-self-improvement.mdc",
         },
     ],
@@ -1436,21 +1495,43 @@ Show a summary of changes made to each file.
 }
 
 
-def get_prompt_templates(category: str = "rules") -> List[Dict]:
-    """Returns prompt templates for the specified category."""
-    return PROMPT_TEMPLATES.get(category, [])
+def get_prompt_templates(category: str = "rules") -> Tuple[Mapping, ...]:
+    """Returns prompt templates for the specified category (read-only)."""
+    return PROMPT_TEMPLATES.get(category, ())
+
 
+def get_prompt_template(category: str, name: str) -> Optional[Mapping]:
+    """Returns a single prompt template by category and name."""
+    return _TEMPLATE_INDEX.get((category, name))
 
-def get_generic_commands() -> Dict:
-    """Returns all generic commands."""
+
+def get_generic_commands() -> Mapping[str, Mapping[str, str]]:
+    """Returns all generic commands as a shared read-only view (no copy is made)."""
     return GENERIC_COMMANDS
 
 
-def get_generic_command(name: str) -> Optional[Dict]:
-    """Returns a specific generic command by name."""
+def get_generic_command(name: str) -> Optional[Mapping[str, str]]:
+    """Returns a specific generic command (including its full body) by name."""
     return GENERIC_COMMANDS.get(name)
 
 
+# Names and descriptions only, for pickers and captions that never show a body
+_GENERIC_COMMAND_NAMES = tuple(GENERIC_COMMANDS)
+_GENERIC_COMMAND_INDEX = MappingProxyType({
+    name: cmd["description"] for name, cmd in GENERIC_COMMANDS.items()
+})
+
+
+def list_generic_command_names() -> Tuple[str, ...]:
+    """Returns the generic command names in display order."""
+    return _GENERIC_COMMAND_NAMES
+
+
+def get_generic_command_index() -> Mapping[str, str]:
+    """Returns generic command descriptions keyed by command name."""
+    return _GENERIC_COMMAND_INDEX
+
+
 # ============================================================================
 # EXTERNAL RESOURCES (VERIFIED)
 # ============================================================================
@@ -1557,14 +1638,11 @@ COMMUNITY_RULE_EXAMPLES = {
         "name": "React + TypeScript",
         "description": "Best practices for React projects with TypeScript",
         "source": "cursor.directory",
-        "content": """---
-description: React and TypeScript coding standards
-globs:
-  - "**/*.tsx"
-  - "**/*.ts"
-  - "src/components/**/*"
-alwaysApply: false
----
+        "content": _rule_frontmatter(
+            "React and TypeScript coding standards",
+            ["**/*.tsx", "**/*.ts", "src/components/**/*"],
+            always_apply=False,
+        ) + """
 
 # React + TypeScript Standards
 
@@ -1595,14 +1673,11 @@ alwaysApply: false
         "name": "Python + FastAPI",
         "description": "Best practices for FastAPI backend projects",
         "source": "cursor.directory",
-        "content": """---
-description: Python FastAPI coding standards
-globs:
-  - "**/*.py"
-  - "app/**/*"
-  - "src/**/*"
-alwaysApply: false
----
+        "content": _rule_frontmatter(
+            "Python FastAPI coding standards",
+            ["**/*.py", "app/**/*", "src/**/*"],
+            always_apply=False,
+        ) + """
 
 # Python FastAPI Standards
 
@@ -1634,15 +1709,11 @@ alwaysApply: false
         "name": "Next.js",
         "description": "Best practices for Next.js applications",
         "source": "cursor.directory",
-        "content": """---
-description: Next.js App Router best practices
-globs:
-  - "**/*.tsx"
-  - "**/*.ts"
-  - "app/**/*"
-  - "components/**/*"
-alwaysApply: false
----
+        "content": _rule_frontmatter(
+            "Next.js App Router best practices",
+            ["**/*.tsx", "**/*.ts", "app/**/*", "components/**/*"],
+            always_apply=False,
+        ) + """
 
 # Next.js App Router Standards
 
@@ -1674,12 +1745,11 @@ alwaysApply: false
         "name": "Go",
         "description": "Best practices for Go projects",
         "source": "Community Best Practices",
-        "content": """---
-description: Go coding standards and best practices
-globs:
-  - "**/*.go"
-alwaysApply: false
----
+        "content": _rule_frontmatter(
+            "Go coding standards and best practices",
+            ["**/*.go"],
+            always_apply=False,
+        ) + """
 
 # Go Standards
 
@@ -1712,13 +1782,11 @@ alwaysApply: false
         "name": "Rust",
         "description": "Best practices for Rust projects",
         "source": "Community Best Practices",
-        "content": """---
-description: Rust coding standards and best practices
-globs:
-  - "**/*.rs"
-  - "Cargo.toml"
-alwaysApply: false
----
+        "content": _rule_frontmatter(
+            "Rust coding standards and best practices",
+            ["**/*.rs", "Cargo.toml"],
+            always_apply=False,
+        ) + """
 
 # Rust Standards
 
@@ -1750,21 +1818,41 @@ alwaysApply: false
 }
 
 
-def get_external_resources(category: str = "all") -> Dict:
+def get_external_resources(category: str = "all") -> Mapping[str, Tuple[Mapping[str, str], ...]]:
     """Returns external resources filtered by category."""
     if category == "all":
         return EXTERNAL_RESOURCES
-    return {category: EXTERNAL_RESOURCES.get(category, [])}
+    return _RESOURCES_BY_CATEGORY.get(category) or {category: ()}
+
+
+def get_resource_by_name(name: str) -> Optional[Mapping[str, str]]:
+    """Returns a single external resource by its display name."""
+    return _RESOURCES_BY_NAME.get(name)
 
 
-def get_community_rule_examples() -> Dict:
+def get_community_rule_examples() -> Mapping[str, Mapping[str, object]]:
     """Returns community rule examples by tech stack."""
     return COMMUNITY_RULE_EXAMPLES
 
 
-def get_community_rule_example(tech: str) -> Optional[Dict]:
-    """Returns a specific community rule example."""
-    return COMMUNITY_RULE_EXAMPLES.get(tech)
+def get_community_rule_example(tech: str) -> Optional[Mapping[str, object]]:
+    """Returns a specific community rule example (tech key is case-insensitive)."""
+    return _COMMUNITY_RULES_BY_KEY.get(tech.lower())
+
+
+# Pre-encode each example once so download buttons don't re-encode per rerun
+COMMUNITY_RULE_EXAMPLES = {
+    tech: {**example, "content_bytes": example["content"].encode("utf-8")}
+    for tech, example in COMMUNITY_RULE_EXAMPLES.items()
+}
+
+# Display labels for the tech selector (tech key -> name), built once at import
+COMMUNITY_RULE_LABELS = {tech: example["name"] for tech, example in COMMUNITY_RULE_EXAMPLES.items()}
+
+
+def get_community_rule_labels() -> Mapping[str, str]:
+    """Returns display names for the community rule examples, keyed by tech."""
+    return COMMUNITY_RULE_LABELS
 
 
 # ============================================================================
@@ -1793,7 +1881,7 @@ QUICK_TIPS = {
 }
 
 
-def get_quick_tips(category: str = "general") -> List[str]:
+def get_quick_tips(category: str = "general") -> Tuple[str, ...]:
     """Returns quick tips for the specified category."""
     return QUICK_TIPS.get(category, QUICK_TIPS["general"])
 
@@ -1803,12 +1891,11 @@ def get_quick_tips(category: str = "general") -> List[str]:
 # ============================================================================
 
 STARTER_KIT_RULES = {
-    "cursor-rules.mdc": """---
-description: Guidelines for writing effective Cursor rules
-globs: 
-  - ".cursor/rules/*"
-alwaysApply: false
----
+    "cursor-rules.mdc": _rule_frontmatter(
+        "Guidelines for writing effective Cursor rules",
+        [".cursor/rules/*"],
+        always_apply=False,
+    ) + """
 
 # Cursor Rules Best Practices
 
@@ -1846,11 +1933,11 @@ Rules can be triggered through:
 - Multiple small focused rules > one giant rule
 """,
 
-    "project-structure.mdc": """---
-description: Project structure and architecture overview
-globs: []
-alwaysApply: true
----
+    "project-structure.mdc": _rule_frontmatter(
+        "Project structure and architecture overview",
+        [],
+        always_apply=True,
+    ) + """
 
 # Project Structure
 
@@ -1898,11 +1985,11 @@ project-root/
 | `VAR_NAME` | Description | Yes/No |
 """,
 
-    "coding-standards.mdc": """---
-description: Coding standards and conventions for this project
-globs: []
-alwaysApply: true
----
+    "coding-standards.mdc": _rule_frontmatter(
+        "Coding standards and conventions for this project",
+        [],
+        always_apply=True,
+    ) + """
 
 # Coding Standards
 
@@ -1940,13 +2027,11 @@ alwaysApply: true
 - Use TODO/FIXME for tracking issues
 """,
 
-    "git-conventions.mdc": """---
-description: Git commit and branching conventions
-globs:
-  - ".git/**"
-  - "*.md"
-alwaysApply: false
----
+    "git-conventions.mdc": _rule_frontmatter(
+        "Git commit and branching conventions",
+        [".git/**", "*.md"],
+        always_apply=False,
+    ) + """
 
 # Git Conventions
 
@@ -1997,12 +2082,11 @@ Closes #123
 ```
 """,
 
-    "rule-self-improvement.mdc": """---
-description: Guidelines for continuously improving Cursor rules
-globs:
-  - ".cursor/rules/*"
-alwaysApply: false
----
+    "rule-self-improvement.mdc": _rule_frontmatter(
+        "Guidelines for continuously improving Cursor rules",
+        [".cursor/rules/*"],
+        always_apply=False,
+    ) + """
 
 # Rule Self-Improvement Guidelines
 
@@ -2041,17 +2125,22 @@ alwaysApply: false
 """,
 }
 
+# Generic commands shipped in the kit, in display order (sync-docs is app-only)
+STARTER_KIT_COMMAND_NAMES = (
+    "code-review-checklist",
+    "write-tests",
+    "debug",
+    "explain",
+    "refactor",
+    "security-audit",
+    "commit",
+    "create-pr",
+    "document",
+    "optimize",
+)
+
 STARTER_KIT_COMMANDS = {
-    "code-review-checklist.md": GENERIC_COMMANDS["code-review-checklist"]["content"],
-    "write-tests.md": GENERIC_COMMANDS["write-tests"]["content"],
-    "debug.md": GENERIC_COMMANDS["debug"]["content"],
-    "explain.md": GENERIC_COMMANDS["explain"]["content"],
-    "refactor.md": GENERIC_COMMANDS["refactor"]["content"],
-    "security-audit.md": GENERIC_COMMANDS["security-audit"]["content"],
-    "commit.md": GENERIC_COMMANDS["commit"]["content"],
-    "create-pr.md": GENERIC_COMMANDS["create-pr"]["content"],
-    "document.md": GENERIC_COMMANDS["document"]["content"],
-    "optimize.md": GENERIC_COMMANDS["optimize"]["content"],
+    f"{name}.md": GENERIC_COMMANDS[name]["content"] for name in STARTER_KIT_COMMAND_NAMES
 }
 
 STARTER_KIT_AGENTS_MD = """# AGENTS.md
@@ -2206,8 +2295,53 @@ Place in your project root for project-wide AI guidance.
 
 Generated by [Cursor Kickstart](https://github.com/Youssefhossamm/cursor_rules_commands)
 """
+STARTER_KIT_AGENTS_MD_BYTES = STARTER_KIT_AGENTS_MD.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_kit_file(content: str) -> bytes:
+    """UTF-8 encodes a kit file once; later ZIP builds reuse the bytes."""
+    return content.encode("utf-8")
+
+
+def _build_zip(entries: Iterable[Tuple[str, str]]) -> bytes:
+    """
+    Writes (archive path, content) pairs into a ZIP and returns its bytes.
+
+    Entries are consumed lazily, so callers can pass a generator and each
+    file is compressed as soon as it is produced.
+    """
+    zip_buffer = io.BytesIO()
+
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for arcname, content in entries:
+            zf.writestr(arcname, _encode_kit_file(content))
+
+    return zip_buffer.getvalue()
+
+
+def _starter_kit_entries() -> Iterator[Tuple[str, str]]:
+    """Yields the (archive path, content) pairs of the default starter kit."""
+    # Rules
+    for filename, content in STARTER_KIT_RULES.items():
+        yield f"cursor-starter-kit/.cursor/rules/{filename}", content
+
+    # Skills (successor to slash commands; same /name invocation)
+    for skill_name, content in STARTER_KIT_SKILLS.items():
+        yield f"cursor-starter-kit/.cursor/skills/{skill_name}/SKILL.md", content
+
+    # Subagent templates
+    for filename, content in STARTER_KIT_SUBAGENTS.items():
+        yield f"cursor-starter-kit/.cursor/agents/{filename}", content
+
+    # Hooks example (users rename to hooks.json to activate)
+    yield "cursor-starter-kit/.cursor/hooks.json.example", STARTER_KIT_HOOKS_EXAMPLE
 
+    yield "cursor-starter-kit/AGENTS.md", STARTER_KIT_AGENTS_MD
+    yield "cursor-starter-kit/README.md", STARTER_KIT_README
 
+
+@functools.lru_cache(maxsize=1)
 def generate_starter_kit_zip() -> bytes:
     """
     Generates a ZIP file containing the complete Cursor starter kit:
@@ -2218,35 +2352,13 @@ def generate_starter_kit_zip() -> bytes:
     actions ship as skills to avoid duplicate /name entries. Use the custom
     kit to include them instead.
 
+    The kit is built from module constants, so the bytes are computed once
+    and the same object is returned on every later call.
+
     Returns:
         bytes: The ZIP file content as bytes
     """
-    zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-        # Add rules
-        for filename, content in STARTER_KIT_RULES.items():
-            zf.writestr(f"cursor-starter-kit/.cursor/rules/{filename}", content)
-
-        # Add skills (successor to slash commands; same /name invocation)
-        for skill_name, content in STARTER_KIT_SKILLS.items():
-            zf.writestr(f"cursor-starter-kit/.cursor/skills/{skill_name}/SKILL.md", content)
-
-        # Add subagent templates
-        for filename, content in STARTER_KIT_SUBAGENTS.items():
-            zf.writestr(f"cursor-starter-kit/.cursor/agents/{filename}", content)
-
-        # Add hooks example (users rename to hooks.json to activate)
-        zf.writestr("cursor-starter-kit/.cursor/hooks.json.example", STARTER_KIT_HOOKS_EXAMPLE)
-
-        # Add AGENTS.md
-        zf.writestr("cursor-starter-kit/AGENTS.md", STARTER_KIT_AGENTS_MD)
-
-        # Add README
-        zf.writestr("cursor-starter-kit/README.md", STARTER_KIT_README)
-
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    return _build_zip(_starter_kit_entries())
 
 
 def get_starter_kit_options() -> Dict[str, Dict[str, str]]:
@@ -2261,10 +2373,10 @@ def get_starter_kit_options() -> Dict[str, Dict[str, str]]:
     command_descriptions = {}
     for name in STARTER_KIT_COMMANDS:
         cmd_key = name.replace(".md", "")
-        command_descriptions[name] = GENERIC_COMMANDS.get(cmd_key, {}).get("description", "")
+        command_descriptions[name] = _GENERIC_COMMAND_INDEX.get(cmd_key, "")
 
     skill_descriptions = {
-        name: GENERIC_COMMANDS.get(name, {}).get("description", "")
+        name: _GENERIC_COMMAND_INDEX.get(name, "")
         for name in STARTER_KIT_SKILLS
     }
 
@@ -2291,35 +2403,33 @@ def generate_custom_starter_kit_zip(
     include_hooks_example: bool = False,
 ) -> bytes:
     """Generates a ZIP file containing only the selected starter kit items."""
-    zip_buffer = io.BytesIO()
 
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+    def entries() -> Iterator[Tuple[str, str]]:
         for filename in selected_rules:
             if filename in STARTER_KIT_RULES:
-                zf.writestr(f"cursor-starter-kit/.cursor/rules/{filename}", STARTER_KIT_RULES[filename])
+                yield f"cursor-starter-kit/.cursor/rules/{filename}", STARTER_KIT_RULES[filename]
 
         for skill_name in (selected_skills or []):
             if skill_name in STARTER_KIT_SKILLS:
-                zf.writestr(f"cursor-starter-kit/.cursor/skills/{skill_name}/SKILL.md", STARTER_KIT_SKILLS[skill_name])
+                yield f"cursor-starter-kit/.cursor/skills/{skill_name}/SKILL.md", STARTER_KIT_SKILLS[skill_name]
 
         for filename in selected_commands:
             if filename in STARTER_KIT_COMMANDS:
-                zf.writestr(f"cursor-starter-kit/.cursor/commands/{filename}", STARTER_KIT_COMMANDS[filename])
+                yield f"cursor-starter-kit/.cursor/commands/{filename}", STARTER_KIT_COMMANDS[filename]
 
         for filename in (selected_subagents or []):
             if filename in STARTER_KIT_SUBAGENTS:
-                zf.writestr(f"cursor-starter-kit/.cursor/agents/{filename}", STARTER_KIT_SUBAGENTS[filename])
+                yield f"cursor-starter-kit/.cursor/agents/{filename}", STARTER_KIT_SUBAGENTS[filename]
 
         if include_hooks_example:
-            zf.writestr("cursor-starter-kit/.cursor/hooks.json.example", STARTER_KIT_HOOKS_EXAMPLE)
+            yield "cursor-starter-kit/.cursor/hooks.json.example", STARTER_KIT_HOOKS_EXAMPLE
 
         if include_agents_md:
-            zf.writestr("cursor-starter-kit/AGENTS.md", STARTER_KIT_AGENTS_MD)
+            yield "cursor-starter-kit/AGENTS.md", STARTER_KIT_AGENTS_MD
 
-        zf.writestr("cursor-starter-kit/README.md", STARTER_KIT_README)
+        yield "cursor-starter-kit/README.md", STARTER_KIT_README
 
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    return _build_zip(entries())
 
 
 def get_starter_kit_contents() -> Dict[str, Dict[str, str]]:
@@ -2604,8 +2714,7 @@ def _command_to_skill(cmd_key: str, cmd: Dict) -> str:
 
 # The 10 starter-kit commands, converted to skills (mirrors /migrate-to-skills output)
 STARTER_KIT_SKILLS = {
-    filename.replace(".md", ""): _command_to_skill(filename.replace(".md", ""), GENERIC_COMMANDS[filename.replace(".md", "")])
-    for filename in STARTER_KIT_COMMANDS
+    name: _command_to_skill(name, GENERIC_COMMANDS[name]) for name in STARTER_KIT_COMMAND_NAMES
 }
 
 
@@ -2840,12 +2949,12 @@ def get_subagents_docs() -> Dict:
     return SUBAGENTS_DOCS
 
 
-def get_starter_kit_skills() -> Dict[str, str]:
+def get_starter_kit_skills() -> Mapping[str, str]:
     """Returns the starter kit skills (name -> SKILL.md content)."""
     return STARTER_KIT_SKILLS
 
 
-def get_starter_kit_subagents() -> Dict[str, str]:
+def get_starter_kit_subagents() -> Mapping[str, str]:
     """Returns the starter kit subagent templates (filename -> content)."""
     return STARTER_KIT_SUBAGENTS
 
@@ -2901,3 +3010,61 @@ WHATS_NEW = [
 def get_whats_new() -> List[Dict]:
     """Returns the Cursor release timeline entries, newest first."""
     return WHATS_NEW
+
+
+# ============================================================================
+# READ-ONLY VIEWS
+# ============================================================================
+# Freeze shared configuration once every section above has registered its
+# entries, so callers can't mutate data that other sessions also read.
+
+GENERIC_COMMANDS = MappingProxyType({
+    name: MappingProxyType(cmd) for name, cmd in GENERIC_COMMANDS.items()
+})
+
+PROMPT_TEMPLATES = MappingProxyType({
+    category: tuple(MappingProxyType(entry) for entry in entries)
+    for category, entries in PROMPT_TEMPLATES.items()
+})
+
+# Kit file tables back the memoized generate_starter_kit_zip(); freezing them
+# keeps the cached ZIP consistent with what the rest of the app displays.
+STARTER_KIT_RULES = MappingProxyType(STARTER_KIT_RULES)
+STARTER_KIT_COMMANDS = MappingProxyType(STARTER_KIT_COMMANDS)
+STARTER_KIT_SKILLS = MappingProxyType(STARTER_KIT_SKILLS)
+STARTER_KIT_SUBAGENTS = MappingProxyType(STARTER_KIT_SUBAGENTS)
+
+EXTERNAL_RESOURCES = MappingProxyType({
+    category: tuple(MappingProxyType(resource) for resource in resources)
+    for category, resources in EXTERNAL_RESOURCES.items()
+})
+
+COMMUNITY_RULE_EXAMPLES = MappingProxyType({
+    tech: MappingProxyType(example) for tech, example in COMMUNITY_RULE_EXAMPLES.items()
+})
+COMMUNITY_RULE_LABELS = MappingProxyType(COMMUNITY_RULE_LABELS)
+
+QUICK_TIPS = MappingProxyType({category: tuple(tips) for category, tips in QUICK_TIPS.items()})
+
+# category -> single-category view, so filtered lookups don't build a dict per call
+_RESOURCES_BY_CATEGORY = {
+    category: MappingProxyType({category: resources})
+    for category, resources in EXTERNAL_RESOURCES.items()
+}
+
+# name -> resource across all categories, for constant-time lookup by name
+_RESOURCES_BY_NAME = {
+    resource["name"]: resource
+    for resources in EXTERNAL_RESOURCES.values()
+    for resource in resources
+}
+
+# Lowercased tech key -> example, so lookups tolerate "React-TypeScript" etc.
+_COMMUNITY_RULES_BY_KEY = {tech.lower(): example for tech, example in COMMUNITY_RULE_EXAMPLES.items()}
+
+# (category, name) -> template, for constant-time lookup by name
+_TEMPLATE_INDEX = {
+    (category, entry["name"]): entry
+    for category, entries in PROMPT_TEMPLATES.items()
+    for entry in entries
+}
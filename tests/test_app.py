@@ -63,3 +63,11 @@ def test_validator_rule_mode_flags_missing_frontmatter(at):
     at.text_area(key="rv_input").set_value("just some text")
     at.run()
     assert any("Missing frontmatter" in e.value for e in at.error)
+
+
+def test_tech_selector_switches_community_rule(at):
+    assert any(m.value == "#### React + TypeScript Rule" for m in at.markdown)
+    at.radio(key="selected_tech").set_value("go")
+    at.run()
+    assert any(m.value == "#### Go Rule" for m in at.markdown)
+    assert not at.exception
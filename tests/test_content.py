@@ -1,8 +1,11 @@
 """Tests for cursor_docs_content: parsing, validators, builders, and the starter kit."""
 
 import io
+import os
 import zipfile
 
+import pytest
+
 import cursor_docs_content as c
 
 
@@ -25,6 +28,29 @@ class TestParseFrontmatter:
         fm, _ = c.parse_frontmatter("---\ndescription: hi")
         assert fm is None
 
+    def test_dashes_inside_value_do_not_close(self):
+        fm, body = c.parse_frontmatter("---\ndescription: a---b\n---\nbody")
+        assert fm == {"description": "a---b"}
+        assert body == "body"
+
+    def test_crlf_line_endings(self):
+        fm, body = c.parse_frontmatter("---\r\ndescription: hi\r\n---\r\n# Body")
+        assert fm == {"description": "hi"}
+        assert body == "# Body"
+
+    def test_trailing_whitespace_on_opening_delimiter(self):
+        for opener in ("--- \n", "---\t\n", "---  \r\n"):
+            fm, body = c.parse_frontmatter(opener + "description: hi\n---\n# Body")
+            assert fm == {"description": "hi"}, repr(opener)
+            assert body == "# Body"
+        rule = "--- \ndescription: x\nalwaysApply: true\n---\n# Body"
+        assert _messages(c.validate_rule(rule), "error") == []
+
+    def test_empty_frontmatter_block(self):
+        fm, body = c.parse_frontmatter("---\n---\n# Body")
+        assert fm is None
+        assert body == "# Body"
+
     def test_invalid_yaml(self):
         fm, _ = c.parse_frontmatter("---\n{ not: valid: yaml\n---\nbody")
         assert fm is None
@@ -71,6 +97,24 @@ class TestValidateRule:
         assert any("Unknown frontmatter" in m for m in _messages(c.validate_rule(rule), "warning"))
 
 
+# ---------------------------------------------------------------------------
+# get_file_annotations
+# ---------------------------------------------------------------------------
+
+class TestFileAnnotations:
+    def test_annotates_known_fields_in_order(self):
+        anns = c.get_file_annotations("r.mdc", GOOD_RULE)
+        assert [a["field"] for a in anns] == ["description", "globs", "alwaysApply"]
+        assert anns[1]["value"] == ["**/*.py"]
+
+    def test_fields_subset(self):
+        anns = c.get_file_annotations("r.mdc", GOOD_RULE, fields=("globs",))
+        assert [a["field"] for a in anns] == ["globs"]
+
+    def test_no_frontmatter(self):
+        assert c.get_file_annotations("cmd.md", "# Just a command") == []
+
+
 # ---------------------------------------------------------------------------
 # validate_skill
 # ---------------------------------------------------------------------------
@@ -145,6 +189,20 @@ class TestBuilders:
         assert "paths:" not in content
         assert "disable-model-invocation" not in content
 
+    def test_template_structure_fallbacks(self):
+        out = c.generate_template_based_structure("Demo", [], "", "")
+        fm, body = c.parse_frontmatter(out)
+        assert fm["alwaysApply"] is True
+        assert "# Project Structure: Demo" in body
+        assert "- Not specified" in body
+        assert "A project built with various technologies." in body
+        assert "├── main.py" in body
+
+    def test_template_structure_accepts_list_and_reuses_render(self):
+        first = c.generate_template_based_structure("Demo", ["Python", "Go"], "app/", "MVC")
+        assert "- **Python**\n- **Go**" in first
+        assert c.generate_template_based_structure("Demo", ["Python", "Go"], "app/", "MVC") is first
+
 
 # ---------------------------------------------------------------------------
 # starter kit
@@ -170,6 +228,14 @@ class TestStarterKit:
         assert any(n.endswith("AGENTS.md") for n in names)
         assert any(n.endswith("README.md") for n in names)
 
+    def test_default_kit_is_built_once(self):
+        assert c.generate_starter_kit_zip() is c.generate_starter_kit_zip()
+
+    def test_kit_tables_are_read_only(self):
+        for table in (c.STARTER_KIT_RULES, c.STARTER_KIT_COMMANDS, c.STARTER_KIT_SKILLS, c.STARTER_KIT_SUBAGENTS):
+            with pytest.raises(TypeError):
+                table["extra.md"] = "x"
+
     def test_all_kit_skills_validate(self):
         zf = zipfile.ZipFile(io.BytesIO(c.generate_starter_kit_zip()))
         for n in zf.namelist():
@@ -179,6 +245,10 @@ class TestStarterKit:
                 errors = [r for r in c.validate_skill(content, folder_name=folder) if r["level"] == "error"]
                 assert errors == [], f"{folder}: {errors}"
 
+    def test_all_kit_rules_validate(self):
+        for fname, content in c.STARTER_KIT_RULES.items():
+            assert _messages(c.validate_rule(content), "error") == [], fname
+
     def test_subagents_have_valid_frontmatter(self):
         for fname, content in c.STARTER_KIT_SUBAGENTS.items():
             fm, body = c.parse_frontmatter(content)
@@ -225,6 +295,36 @@ class TestDocsData:
         assert '"version": 1' in h["example"]
         assert "options_summary" in h
 
+    def test_comparison_and_frontmatter_docs(self):
+        assert c.get_comparison_table().startswith("| Aspect | Rules | Commands |")
+        docs = c.get_rule_frontmatter_docs()
+        for field in c.FRONTMATTER_FIELDS:
+            assert f"### `{field}`" in docs
+
+    def test_comparison_data_rows(self):
+        rows = c.get_comparison_data()
+        assert [r["aspect"] for r in rows][:3] == ["Purpose", "Location", "Triggered By"]
+        assert rows[0]["rules"] == c.RULES_VS_COMMANDS["rules"]["purpose"]
+        with pytest.raises(TypeError):
+            rows[0]["rules"] = "x"
+
+    def test_resource_lookup_by_name(self):
+        res = c.get_resource_by_name("cursor.directory")
+        assert res["url"] == "https://cursor.directory"
+        assert res in c.get_external_resources("community")["community"]
+        assert c.get_resource_by_name("missing") is None
+
+    def test_community_rule_lookup_ignores_case(self):
+        assert c.get_community_rule_example("React-TypeScript") is c.COMMUNITY_RULE_EXAMPLES["react-typescript"]
+        assert c.get_community_rule_example("cobol") is None
+
+    def test_community_rules_validate(self):
+        for tech, example in c.get_community_rule_examples().items():
+            assert _messages(c.validate_rule(example["content"]), "error") == [], tech
+            assert c.parse_frontmatter(example["content"])[0]["alwaysApply"] is False
+            assert example["content_bytes"] == example["content"].encode("utf-8")
+        assert not hasattr(c, "_example")
+
     def test_skills_docs_keys(self):
         sd = c.get_skills_docs()
         for key in ("overview", "locations", "bundled_dirs", "builtin_skills", "migration", "example"):
@@ -241,7 +341,38 @@ class TestDocsData:
         assert len(c.get_prompt_templates("commands")) == 3
         assert len(c.get_prompt_templates("skills")) == 2
         assert len(c.get_prompt_templates("subagents")) == 2
-        assert c.get_prompt_templates("nonexistent") == []
+        assert c.get_prompt_templates("nonexistent") == ()
+
+    def test_prompt_template_lookup_by_name(self):
+        entry = c.get_prompt_template("rules", "Coding Standards Rule")
+        assert entry is c.get_prompt_templates("rules")[1]
+        assert c.get_prompt_template("commands", "Coding Standards Rule") is None
+
+    def test_shared_config_is_read_only(self):
+        with pytest.raises(TypeError):
+            c.get_generic_command("debug")["content"] = "x"
+        with pytest.raises(TypeError):
+            c.get_prompt_templates("rules")[0]["prompt"] = "x"
+        with pytest.raises(TypeError):
+            c.get_generic_commands()["new-command"] = {}
+        assert c.get_generic_commands() is c.get_generic_commands()
+
+    def test_generic_command_index(self):
+        names = c.list_generic_command_names()
+        assert names == tuple(c.get_generic_commands())
+        index = c.get_generic_command_index()
+        assert set(index) == set(names)
+        assert index["debug"] == c.get_generic_command("debug")["description"]
+
+    def test_resources_and_tips_are_read_only(self):
+        with pytest.raises(TypeError):
+            c.get_resource_by_name(c.get_external_resources()["official"][0]["name"])["url"] = "x"
+        with pytest.raises(TypeError):
+            c.get_community_rule_example("go")["content"] = "x"
+        assert isinstance(c.get_quick_tips("rules"), tuple)
+        assert c.get_external_resources("nonexistent") == {"nonexistent": ()}
+        assert c.get_external_resources("official") is c.get_external_resources("official")
+        assert c.get_external_resources("official")["official"] is c.EXTERNAL_RESOURCES["official"]
 
     def test_rule_prompts_output_mdc(self):
         for p in c.get_prompt_templates("rules"):
@@ -258,3 +389,46 @@ class TestDocsData:
         assert len(ex["rules"]) == 3
         assert all(name.endswith(".mdc") for name in ex["rules"])
         assert len(ex["commands"]) == 7
+
+    def test_example_files_cached_between_calls(self):
+        assert c.load_example_files() is c.load_example_files()
+
+    def test_example_files_reload_when_directory_changes(self, tmp_path, monkeypatch):
+        rules_dir = tmp_path / ".cursor" / "rules"
+        rules_dir.mkdir(parents=True)
+        (rules_dir / "a.mdc").write_text("---\ndescription: a\n---\n", encoding="utf-8")
+        monkeypatch.setattr(c, "get_project_root", lambda: tmp_path)
+
+        assert list(c.load_example_files()["rules"]) == ["a.mdc"]
+        (rules_dir / "b.mdc").write_text("---\ndescription: b\n---\n", encoding="utf-8")
+        assert list(c.load_example_files()["rules"]) == ["a.mdc", "b.mdc"]
+
+    def test_example_files_reload_when_file_edited(self, tmp_path, monkeypatch):
+        rule = tmp_path / ".cursor" / "rules" / "a.mdc"
+        rule.parent.mkdir(parents=True)
+        rule.write_text("v1", encoding="utf-8")
+        monkeypatch.setattr(c, "get_project_root", lambda: tmp_path)
+
+        assert c.load_example_files()["rules"]["a.mdc"] == "v1"
+        rule.write_text("v2", encoding="utf-8")
+        os.utime(rule, ns=(0, 1))  # force a distinct mtime on coarse filesystems
+        assert c.load_example_files()["rules"]["a.mdc"] == "v2"
+
+    def test_example_files_keyed_by_root(self, tmp_path, monkeypatch):
+        for root, text in (("one", "first"), ("two", "second")):
+            rule = tmp_path / root / ".cursor" / "rules" / "a.mdc"
+            rule.parent.mkdir(parents=True)
+            rule.write_text(text, encoding="utf-8")
+            os.utime(rule, ns=(0, 1))  # identical mtimes in both roots
+
+        monkeypatch.setattr(c, "get_project_root", lambda: tmp_path / "one")
+        assert c.load_example_files()["rules"]["a.mdc"] == "first"
+        monkeypatch.setattr(c, "get_project_root", lambda: tmp_path / "two")
+        assert c.load_example_files()["rules"]["a.mdc"] == "second"
+
+    def test_example_files_are_read_only(self):
+        examples = c.load_example_files()
+        with pytest.raises(TypeError):
+            examples["rules"]["new.mdc"] = "x"
+        with pytest.raises(TypeError):
+            examples["extra"] = {}